@@ -79,11 +79,21 @@ describe('siteQuirks', () => {
   test('CNN live blogs are flagged as null', () => {
     const text = 'Live blog content';
     expect(siteQuirks(text, 'https://www.cnn.com/live-news/updates')).toBeNull();
+    expect(siteQuirks(text, 'https://edition.cnn.com/world/live-updates/x')).toBeNull();
+    expect(siteQuirks(text, 'http://cnn.com:80/live-news/a')).toBeNull();
+    expect(siteQuirks(text, 'https://user@www.cnn.com/live-news/a')).toBeNull();
+    expect(siteQuirks(text, '//www.cnn.com/live-news/x')).toBeNull();
+    expect(siteQuirks(text, '  https://www.cnn.com/live-news/x')).toBeNull();
+    expect(siteQuirks(text, 'https://www.cnn.com./live-news/x')).toBeNull();
+    expect(siteQuirks(text, 'https://cnn.com?live-news')).toBeNull();
+    expect(siteQuirks(text, 'https://cnn.com#live-news')).toBeNull();
   });
 
   test('CNN non-live pages pass through', () => {
     const text = 'Regular CNN article';
     expect(siteQuirks(text, 'https://www.cnn.com/2024/01/01/article')).toBe('Regular CNN article');
+    expect(siteQuirks(text, 'https://example.com/cnn.com/live-news/x')).toBe('Regular CNN article');
+    expect(siteQuirks(text, 'https://cnn.com.evil.org/live-news')).toBe('Regular CNN article');
   });
 });
 
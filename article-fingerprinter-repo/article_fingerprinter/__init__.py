@@ -5,12 +5,7 @@ A production-ready library for extracting, normalizing, and fingerprinting
 web article content with high reliability and consensus validation.
 """
 
-from .quirks import QuirksProcessor
-from .extractors import ArticleExtractor
-from .metadata import MetadataExtractor
-from .supermajority import SupermajorityExtractor
-from .fingerprinter import ArticleFingerprinter
-from .reports import ReportGenerator
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -21,3 +16,28 @@ __all__ = [
     "ArticleFingerprinter",
     "ReportGenerator",
 ]
+
+# Public name → submodule. Submodules are imported on first attribute
+# access (PEP 562): the extractors pull in newspaper, readability,
+# trafilatura and goose, which take ~0.2 s to import.
+_SUBMODULES = {
+    "QuirksProcessor": ".quirks",
+    "ArticleExtractor": ".extractors",
+    "MetadataExtractor": ".metadata",
+    "SupermajorityExtractor": ".supermajority",
+    "ArticleFingerprinter": ".fingerprinter",
+    "ReportGenerator": ".reports",
+}
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + [name for name in __all__ if name not in globals()])
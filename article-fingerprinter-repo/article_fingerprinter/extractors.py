@@ -4,12 +4,28 @@ Article Extractors Module
 Provides unified interface to multiple article extraction libraries.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from newspaper import Article as NewspaperArticle
 from readability import Document as ReadabilityDocument
-from bs4 import BeautifulSoup
+from lxml import etree
 import trafilatura
 from goose3 import Goose
+from .metadata import MetadataExtractor
+
+
+# Shared pool (one worker per extractor) so threads are started only once
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='extractor')
+
+# Goose instances are costly to build and not thread-safe: one per worker
+_goose_local = threading.local()
+
+# Visible text nodes (comments are not text nodes)
+_TEXT_NODES = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::template)]',
+    smart_strings=False
+)
 
 
 class ArticleExtractor:
@@ -28,9 +44,18 @@ class ArticleExtractor:
     def extract_readability(html: str) -> str:
         """Extract using Python-Readability"""
         doc = ReadabilityDocument(html)
-        content_html = doc.summary()
-        soup = BeautifulSoup(content_html, 'lxml')
-        return soup.get_text(separator=' ', strip=True)
+        return ArticleExtractor.summary_text(doc.summary())
+    
+    @staticmethod
+    def summary_text(content_html: str) -> str:
+        """
+        Visible text of a readability summary, whitespace-collapsed
+        
+        Skips script/style/template contents and comments; element tails
+        are kept. Empty or comment-only summaries give empty text.
+        """
+        tree = MetadataExtractor.parse_html(content_html)
+        return ' '.join(' '.join(_TEXT_NODES(tree)).split())
     
     @staticmethod
     def extract_trafilatura(html: str) -> str:
@@ -46,7 +71,9 @@ class ArticleExtractor:
     @staticmethod
     def extract_goose(html: str) -> str:
         """Extract using Goose3"""
-        g = Goose()
+        g = getattr(_goose_local, 'goose', None)
+        if g is None:
+            g = _goose_local.goose = Goose()
         article = g.extract(raw_html=html)
         return article.cleaned_text or ""
     
@@ -55,6 +82,9 @@ class ArticleExtractor:
         """
         Extract with all available extractors
         
+        Extractors run concurrently on a shared thread pool; most of
+        their time is spent in lxml, which releases the GIL.
+        
         Returns:
             Dict mapping extractor name to extracted text
         """
@@ -65,14 +95,19 @@ class ArticleExtractor:
             'goose': cls.extract_goose,
         }
         
-        results = {}
+        futures = {}
         for name, extractor_func in extractors.items():
+            if name == 'newspaper':
+                futures[name] = _EXECUTOR.submit(extractor_func, html, url)
+            else:
+                futures[name] = _EXECUTOR.submit(extractor_func, html)
+        
+        # Collect in submission order: the first extractor drives
+        # sentence ordering in supermajority voting
+        results = {}
+        for name, future in futures.items():
             try:
-                if name == 'newspaper':
-                    text = extractor_func(html, url)
-                else:
-                    text = extractor_func(html)
-                results[name] = text
+                results[name] = future.result()
             except Exception as e:
                 results[name] = f"ERROR: {str(e)}"
         
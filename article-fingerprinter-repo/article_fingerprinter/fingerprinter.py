@@ -5,16 +5,61 @@ Main fingerprinting orchestration with consensus validation.
 """
 
 import hashlib
+import heapq
 from datetime import datetime
-from typing import Dict
-from difflib import SequenceMatcher
+from typing import Dict, Tuple
 
-from .quirks import QuirksProcessor
+from .quirks import default_quirks
 from .extractors import ArticleExtractor
 from .metadata import MetadataExtractor
 from .supermajority import SupermajorityExtractor
 
 
+# MinHash parameters for pairwise similarity. Shingles are character
+# k-grams over the text with whitespace removed, so extractor quirks that
+# only move spaces (e.g. readability's quote spacing) don't lower scores.
+MINHASH_SKETCH_SIZE = 128
+SHINGLE_SIZE = 8
+
+
+def minhash_signature(data: bytes) -> Tuple[int, ...]:
+    """
+    Build a bottom-k MinHash signature from character shingles
+    
+    Takes UTF-8 encoded text. Whitespace is dropped, each SHINGLE_SIZE-byte
+    window is hashed once and the signature keeps the MINHASH_SKETCH_SIZE
+    smallest distinct hash values, in ascending order.
+    """
+    data = b''.join(data.split())
+    shingles = {
+        data[i:i + SHINGLE_SIZE]
+        for i in range(max(1, len(data) - SHINGLE_SIZE + 1))
+    }
+    hashes = {
+        int.from_bytes(hashlib.blake2b(shingle, digest_size=8, usedforsecurity=False).digest(), 'little')
+        for shingle in shingles
+    }
+    return tuple(heapq.nsmallest(MINHASH_SKETCH_SIZE, hashes))
+
+
+def minhash_similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """
+    Estimate shingle similarity from two bottom-k MinHash signatures
+    
+    The Jaccard estimate J is the share of the k smallest values of the
+    union of both sketches that appear in both. It is returned as the
+    Dice coefficient 2J / (1 + J), which like SequenceMatcher.ratio()
+    counts matches against the combined size of both texts.
+    """
+    union = heapq.nsmallest(MINHASH_SKETCH_SIZE, set(sig1).union(sig2))
+    if not union:
+        return 0.0
+    
+    both = set(sig1).intersection(sig2)
+    jaccard = sum(h in both for h in union) / len(union)
+    return 2 * jaccard / (1 + jaccard)
+
+
 class ArticleFingerprinter:
     """
     Main article fingerprinting class
@@ -28,7 +73,7 @@ class ArticleFingerprinter:
     """
     
     def __init__(self):
-        self.quirks = QuirksProcessor()
+        self.quirks = default_quirks
         self.extractor = ArticleExtractor()
         self.metadata_extractor = MetadataExtractor()
         self.supermajority = SupermajorityExtractor()
@@ -53,8 +98,10 @@ class ArticleFingerprinter:
         """
         start_time = datetime.now()
         
-        # Extract metadata
-        metadata = self.metadata_extractor.extract_metadata(html, url)
+        # Parse once and extract metadata from the shared tree
+        # (the extraction libraries need the raw HTML string)
+        tree = self.metadata_extractor.parse_html(html)
+        metadata = self.metadata_extractor.extract_metadata_from_tree(tree, url)
         
         # Extract with all extractors (raw)
         raw_extractions = self.extractor.extract_all(html, url)
@@ -66,10 +113,14 @@ class ArticleFingerprinter:
             if result:
                 processed[extractor] = result
         
-        # Calculate stats after quirks
+        # Encode once; the bytes feed both the group hashes and MinHash
+        encoded = {lib: text.encode('utf-8') for lib, text in processed.items()}
+        
+        # Calculate stats after quirks (64-bit BLAKE2b: only used for grouping).
+        # Raw digests are compared; hex is only produced for the output.
         hashes_after_quirks = {
-            lib: hashlib.sha256(text.encode()).hexdigest()
-            for lib, text in processed.items()
+            lib: hashlib.blake2b(data, digest_size=8, usedforsecurity=False).digest()
+            for lib, data in encoded.items()
         }
         unique_hashes = len(set(hashes_after_quirks.values()))
         
@@ -83,19 +134,32 @@ class ArticleFingerprinter:
         # Supermajority extraction
         optimal_threshold = 3 if len(processed) >= 3 else 2
         supermaj_text, voting_stats = self.supermajority.extract(processed, optimal_threshold)
-        supermaj_hash = hashlib.sha256(supermaj_text.encode()).hexdigest()
+        supermaj_hash = hashlib.sha256(supermaj_text.encode(), usedforsecurity=False).hexdigest()
+        
+        # Quirks leave ASCII spaces as the only whitespace, so
+        # splitting the bytes gives the same words as splitting the str.
+        word_counts = {lib: len(data.split()) for lib, data in encoded.items()}
+        # Processed extractors never hold "ERROR:" raw text
+        raw_word_counts = {lib: len(raw_extractions[lib].split()) for lib in processed}
+        supermaj_word_count = len(supermaj_text.split())
+        
+        # Calculate consensus scores (MinHash estimate of shingle overlap)
+        signatures = {lib: minhash_signature(data) for lib, data in encoded.items()}
         
-        # Calculate consensus scores
         similarities = []
-        for i, (lib1, text1) in enumerate(processed.items()):
-            for lib2, text2 in list(processed.items())[i+1:]:
-                sim = SequenceMatcher(None, text1, text2).ratio()
+        libs = list(processed)
+        for i, lib1 in enumerate(libs):
+            for lib2 in libs[i+1:]:
+                if hashes_after_quirks[lib1] == hashes_after_quirks[lib2]:
+                    sim = 1.0  # Identical after quirks (common for readability/trafilatura)
+                else:
+                    sim = minhash_similarity(signatures[lib1], signatures[lib2])
                 similarities.append({
                     'lib1': lib1,
                     'lib2': lib2,
                     'similarity': sim,
-                    'wc1': len(text1.split()),
-                    'wc2': len(text2.split()),
+                    'wc1': word_counts[lib1],
+                    'wc2': word_counts[lib2],
                 })
         
         avg_similarity = sum(s['similarity'] for s in similarities) / len(similarities) if similarities else 0
@@ -110,9 +174,9 @@ class ArticleFingerprinter:
         else:
             confidence = "low"
         
-        # Build article_id
+        # Build article_id (SHA-256, must match the browser extension)
         article_id_source = f"{metadata['canonical_url']}|{metadata['publish_date']}|{metadata['title']}"
-        article_id = hashlib.sha256(article_id_source.encode()).hexdigest()[:16]
+        article_id = hashlib.sha256(article_id_source.encode(), usedforsecurity=False).hexdigest()[:16]
         
         # Compile results
         results = {
@@ -122,7 +186,7 @@ class ArticleFingerprinter:
                 'extraction_method': f'supermajority_{optimal_threshold}_of_{len(processed)}_with_quirks',
                 'confidence': confidence,
                 'agreement_score': avg_similarity,
-                'word_count': len(supermaj_text.split()),
+                'word_count': supermaj_word_count,
             },
             'metadata': metadata,
             'extraction_stats': {
@@ -134,9 +198,9 @@ class ArticleFingerprinter:
             },
             'individual_extractions': {
                 lib: {
-                    'raw_word_count': len(raw_extractions[lib].split()) if lib in raw_extractions and not raw_extractions[lib].startswith("ERROR:") else 0,
-                    'processed_word_count': len(text.split()),
-                    'hash': hashes_after_quirks[lib],
+                    'raw_word_count': raw_word_counts[lib],
+                    'processed_word_count': word_counts[lib],
+                    'hash': hashes_after_quirks[lib].hex(),
                     'preview': text[:200] + '...' if len(text) > 200 else text,
                 }
                 for lib, text in processed.items()
@@ -144,7 +208,7 @@ class ArticleFingerprinter:
             'pairwise_similarities': similarities,
             'voting_stats': voting_stats,
             'supermajority_extraction': {
-                'word_count': len(supermaj_text.split()),
+                'word_count': supermaj_word_count,
                 'hash': supermaj_hash,
                 'text': supermaj_text,
             },
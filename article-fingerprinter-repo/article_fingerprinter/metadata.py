@@ -10,14 +10,42 @@ Extracts structured metadata from HTML documents including:
 
 import json
 from typing import Dict
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+
+_UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+_JSON_LD = etree.XPath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+_OG_TITLE = etree.XPath('//meta[@property="og:title"]')
+_OG_PUBLISHED = etree.XPath('//meta[@property="article:published_time"]')
+_OG_MODIFIED = etree.XPath('//meta[@property="article:modified_time"]')
+# rel is a space-separated token list
+_CANONICAL = etree.XPath('//link[contains(concat(" ", normalize-space(@rel), " "), " canonical ")]')
+_TITLE = etree.XPath('//title')
 
 
 class MetadataExtractor:
     """Extract article metadata from HTML"""
     
     @staticmethod
-    def extract_metadata(html: str, url: str) -> Dict:
+    def parse_html(html: str) -> lxml_html.HtmlElement:
+        """
+        Parse HTML into an lxml tree that can be shared across consumers
+        
+        Documents with an XML encoding declaration can't be parsed from
+        a str, so they are re-encoded as UTF-8 first.
+        """
+        try:
+            try:
+                return lxml_html.document_fromstring(html)
+            except ValueError:
+                return lxml_html.document_fromstring(html.encode('utf-8'), parser=_UTF8_PARSER)
+        except etree.ParserError:
+            # Empty document (with or without an encoding declaration)
+            return lxml_html.document_fromstring('<html></html>')
+    
+    @classmethod
+    def extract_metadata(cls, html: str, url: str) -> Dict:
         """
         Extract comprehensive metadata from HTML
         
@@ -28,7 +56,16 @@ class MetadataExtractor:
             - publish_date, modified_date
             - has_schema_org, has_opengraph, has_canonical
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return cls.extract_metadata_from_tree(cls.parse_html(html), url)
+    
+    @staticmethod
+    def extract_metadata_from_tree(tree: lxml_html.HtmlElement, url: str) -> Dict:
+        """
+        Extract metadata from an already-parsed lxml tree
+        
+        Same fields as extract_metadata(), using XPath instead of
+        re-parsing the HTML.
+        """
         metadata = {
             'url': url,
             'canonical_url': url,
@@ -42,9 +79,12 @@ class MetadataExtractor:
         }
         
         # Schema.org JSON-LD
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script_text in _JSON_LD(tree):
+            # Most pages carry several JSON-LD blocks; only parse Article ones
+            if 'Article' not in script_text:
+                continue
             try:
-                data = json.loads(script.string)
+                data = json.loads(script_text)
                 if isinstance(data, dict) and 'Article' in str(data.get('@type', '')):
                     metadata['has_schema_org'] = True
                     metadata['title'] = metadata['title'] or data.get('headline')
@@ -61,28 +101,28 @@ class MetadataExtractor:
                 continue
         
         # Open Graph
-        og_title = soup.find('meta', property='og:title')
+        og_title = _OG_TITLE(tree)
         if og_title:
             metadata['has_opengraph'] = True
-            metadata['title'] = metadata['title'] or og_title.get('content')
+            metadata['title'] = metadata['title'] or og_title[0].get('content')
         
-        og_pub = soup.find('meta', property='article:published_time')
+        og_pub = _OG_PUBLISHED(tree)
         if og_pub:
-            metadata['publish_date'] = metadata['publish_date'] or og_pub.get('content')
+            metadata['publish_date'] = metadata['publish_date'] or og_pub[0].get('content')
         
-        og_mod = soup.find('meta', property='article:modified_time')
+        og_mod = _OG_MODIFIED(tree)
         if og_mod:
-            metadata['modified_date'] = metadata['modified_date'] or og_mod.get('content')
+            metadata['modified_date'] = metadata['modified_date'] or og_mod[0].get('content')
         
         # Canonical
-        canonical = soup.find('link', rel='canonical')
+        canonical = _CANONICAL(tree)
         if canonical:
             metadata['has_canonical'] = True
-            metadata['canonical_url'] = canonical.get('href', url)
+            metadata['canonical_url'] = canonical[0].get('href', url)
         
         # Fallback title
         if not metadata['title']:
-            title_tag = soup.find('title')
-            metadata['title'] = title_tag.get_text() if title_tag else 'Unknown'
+            title_tag = _TITLE(tree)
+            metadata['title'] = title_tag[0].text_content() if title_tag else 'Unknown'
         
         return metadata
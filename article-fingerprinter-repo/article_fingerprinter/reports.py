@@ -18,7 +18,7 @@ class ReportGenerator:
         meta = results['metadata']
         stats = results['extraction_stats']
         
-        md = f"""# Article Fingerprint Report
+        parts = [f"""# Article Fingerprint Report
 
 ## Primary Fingerprint
 
@@ -50,38 +50,38 @@ class ReportGenerator:
 
 ### Hash Groups (After Quirks)
 
-"""
+"""]
         for i, group in enumerate(stats['hash_groups'], 1):
-            md += f"{i}. {', '.join(group)}\n"
+            parts.append(f"{i}. {', '.join(group)}\n")
         
-        md += "\n## Individual Extractions\n\n"
-        md += "| Extractor | Raw Words | After Quirks | Hash | Preview |\n"
-        md += "|-----------|-----------|--------------|------|----------|\n"
+        parts.append("\n## Individual Extractions\n\n")
+        parts.append("| Extractor | Raw Words | After Quirks | Hash | Preview |\n")
+        parts.append("|-----------|-----------|--------------|------|----------|\n")
         
         for lib, data in results['individual_extractions'].items():
             preview = data['preview'].replace('|', '\\|')[:100]
-            md += f"| {lib} | {data['raw_word_count']:,} | {data['processed_word_count']:,} | `{data['hash'][:16]}...` | {preview}... |\n"
+            parts.append(f"| {lib} | {data['raw_word_count']:,} | {data['processed_word_count']:,} | `{data['hash']}` | {preview}... |\n")
         
-        md += "\n## Pairwise Similarities\n\n"
-        md += "| Extractor 1 | Extractor 2 | Similarity | Words 1 | Words 2 | Difference |\n"
-        md += "|-------------|-------------|------------|---------|---------|------------|\n"
+        parts.append("\n## Pairwise Similarities\n\n")
+        parts.append("| Extractor 1 | Extractor 2 | Similarity | Words 1 | Words 2 | Difference |\n")
+        parts.append("|-------------|-------------|------------|---------|---------|------------|\n")
         
         for sim in results['pairwise_similarities']:
-            md += f"| {sim['lib1']} | {sim['lib2']} | {sim['similarity']:.2%} | {sim['wc1']:,} | {sim['wc2']:,} | {abs(sim['wc1'] - sim['wc2']):,} |\n"
+            parts.append(f"| {sim['lib1']} | {sim['lib2']} | {sim['similarity']:.2%} | {sim['wc1']:,} | {sim['wc2']:,} | {abs(sim['wc1'] - sim['wc2']):,} |\n")
         
-        md += "\n## Supermajority Voting\n\n"
+        parts.append("\n## Supermajority Voting\n\n")
         
         for vote_count in [4, 3, 2, 1]:
             sentences = results['voting_stats']['by_vote_count'][vote_count]
             if sentences:
-                md += f"### {vote_count}/4 Extractors ({len(sentences)} sentences)\n\n"
+                parts.append(f"### {vote_count}/4 Extractors ({len(sentences)} sentences)\n\n")
                 for sent in sentences[:5]:
-                    md += f"- {sent}\n"
+                    parts.append(f"- {sent}\n")
                 if len(sentences) > 5:
-                    md += f"- *... and {len(sentences) - 5} more*\n"
-                md += "\n"
+                    parts.append(f"- *... and {len(sentences) - 5} more*\n")
+                parts.append("\n")
         
-        md += f"""## Final Supermajority Extraction
+        parts.append(f"""## Final Supermajority Extraction
 
 - **Threshold:** {stats['supermajority_threshold']} extractors
 - **Word Count:** {results['supermajority_extraction']['word_count']:,} words
@@ -95,9 +95,9 @@ class ReportGenerator:
 
 *Generated: {results['extracted_at']}*  
 *Processing Time: {results['processing_time_ms']:.2f}ms*
-"""
+""")
         
-        return md
+        return ''.join(parts)
     
     @staticmethod
     def generate_html(results: Dict) -> str:
@@ -107,26 +107,34 @@ class ReportGenerator:
         stats = results['extraction_stats']
         
         # Build components
-        hash_groups_html = ""
-        for i, group in enumerate(stats['hash_groups'], 1):
-            hash_groups_html += f"<div class='hash-group'>Group {i}: {', '.join(group)}</div>\n"
+        hash_groups_html = ''.join(
+            f"<div class='hash-group'>Group {i}: {', '.join(group)}</div>\n"
+            for i, group in enumerate(stats['hash_groups'], 1)
+        )
+        
+        # Escaped values only ever land in element text, never in attributes,
+        # so quotes don't need escaping (quote=False)
+        escaped_previews = {
+            lib: html_module.escape(data['preview'], quote=False)
+            for lib, data in results['individual_extractions'].items()
+        }
         
-        extractions_html = ""
+        extractions_parts = []
         for lib, data in results['individual_extractions'].items():
-            preview_escaped = html_module.escape(data['preview'])
-            extractions_html += f"""
+            extractions_parts.append(f"""
             <tr>
                 <td>{lib}</td>
                 <td>{data['raw_word_count']:,}</td>
                 <td>{data['processed_word_count']:,}</td>
-                <td class='hash'>{data['hash'][:32]}...</td>
-                <td class='preview'>{preview_escaped}</td>
-            </tr>"""
+                <td class='hash'>{data['hash']}</td>
+                <td class='preview'>{escaped_previews[lib]}</td>
+            </tr>""")
+        extractions_html = ''.join(extractions_parts)
         
-        similarities_html = ""
+        similarities_parts = []
         for sim in results['pairwise_similarities']:
             color = 'green' if sim['similarity'] > 0.95 else 'orange' if sim['similarity'] > 0.80 else 'red'
-            similarities_html += f"""
+            similarities_parts.append(f"""
             <tr>
                 <td>{sim['lib1']}</td>
                 <td>{sim['lib2']}</td>
@@ -134,18 +142,20 @@ class ReportGenerator:
                 <td>{sim['wc1']:,}</td>
                 <td>{sim['wc2']:,}</td>
                 <td>{abs(sim['wc1'] - sim['wc2']):,}</td>
-            </tr>"""
+            </tr>""")
+        similarities_html = ''.join(similarities_parts)
         
-        voting_html = ""
+        voting_parts = []
         for vote_count in [4, 3, 2, 1]:
             sentences = results['voting_stats']['by_vote_count'][vote_count]
             if sentences:
-                voting_html += f"<h4>{vote_count}/4 Extractors ({len(sentences)} sentences)</h4>\n<ul>\n"
+                voting_parts.append(f"<h4>{vote_count}/4 Extractors ({len(sentences)} sentences)</h4>\n<ul>\n")
                 for sent in sentences[:5]:
-                    voting_html += f"<li>{html_module.escape(sent)}</li>\n"
+                    voting_parts.append(f"<li>{html_module.escape(sent, quote=False)}</li>\n")
                 if len(sentences) > 5:
-                    voting_html += f"<li><em>... and {len(sentences) - 5} more</em></li>\n"
-                voting_html += "</ul>\n"
+                    voting_parts.append(f"<li><em>... and {len(sentences) - 5} more</em></li>\n")
+                voting_parts.append("</ul>\n")
+        voting_html = ''.join(voting_parts)
         
         conf_colors = {'very_high': '#28a745', 'high': '#5cb85c', 'medium': '#ffc107', 'low': '#dc3545'}
         conf_color = conf_colors.get(fp['confidence'], '#6c757d')
@@ -185,9 +195,9 @@ tr:hover{{background:#f8f9fa}}
 </div>
 <h2>📋 Metadata</h2>
 <div class="metadata">
-<div><span class="key">URL:</span> {html_module.escape(meta['url'])}</div>
-<div><span class="key">Title:</span> {html_module.escape(meta['title'])}</div>
-<div><span class="key">Published:</span> {html_module.escape(meta['publish_date']) if meta['publish_date'] else 'Not found'}</div>
+<div><span class="key">URL:</span> {html_module.escape(meta['url'], quote=False)}</div>
+<div><span class="key">Title:</span> {html_module.escape(meta['title'], quote=False)}</div>
+<div><span class="key">Published:</span> {html_module.escape(meta['publish_date'], quote=False) if meta['publish_date'] else 'Not found'}</div>
 </div>
 <h2>📊 Extraction Statistics</h2>
 <h3>Hash Groups</h3>{hash_groups_html}
@@ -198,7 +208,7 @@ tr:hover{{background:#f8f9fa}}
 <h2>🗳️ Supermajority Voting</h2>{voting_html}
 <div class="fingerprint-box"><h3>Final Supermajority Extraction</h3>
 <p><strong>Word Count:</strong> {results['supermajority_extraction']['word_count']:,} words</p>
-<p style="white-space:pre-wrap">{html_module.escape(results['supermajority_extraction']['text'][:500])}...</p>
+<p style="white-space:pre-wrap">{html_module.escape(results['supermajority_extraction']['text'][:500], quote=False)}...</p>
 </div>
 <p style="text-align:center;color:#999;margin-top:30px">Generated: {results['extracted_at']}<br>Processing Time: {results['processing_time_ms']:.2f}ms</p>
 </div></body></html>"""
@@ -8,6 +8,9 @@ import re
 from typing import Dict, List, Tuple
 
 
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
 class SupermajorityExtractor:
     """Supermajority voting for sentence extraction"""
     
@@ -17,9 +20,11 @@ class SupermajorityExtractor:
         Split text into sentences
         
         Filters out very short sentences (< 20 chars) to avoid noise.
+        Whitespace is collapsed once over the whole text, so sentences
+        come back stripped and single-spaced for any input.
         """
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if len(s.strip()) > 20]
+        text = ' '.join(text.split())
+        return [s for s in _SENT_SPLIT.split(text) if len(s) > 20]
     
     @classmethod
     def extract(cls, texts: Dict[str, str], min_extractors: int = 3) -> Tuple[str, dict]:
@@ -37,48 +42,45 @@ class SupermajorityExtractor:
             - total_unique_sentences
             - sentences_kept
             - by_vote_count: {4: [...], 3: [...], 2: [...], 1: [...]}
+              (keys run from max(4, len(texts)) down to 1)
             - threshold
         """
-        sentence_to_extractors = {}
-        sentence_order = []
+        # Sentence → bitmask of the extractors that produced it; the vote
+        # count is the mask's popcount. Python ints are unbounded, so there
+        # is no cap on the number of extractors.
+        extractor_bit = {lib: 1 << i for i, lib in enumerate(texts)}
+        votes = {}
         
-        # Use first extractor for ordering
-        first_lib = list(texts.keys())[0]
-        first_sentences = cls.extract_sentences(texts[first_lib])
+        # Use first extractor for ordering: its sentences are inserted first
+        first_lib = next(iter(texts))
+        first_count = 0
         
         # Count votes
         for lib, text in texts.items():
             if not text or text.startswith("ERROR:"):
                 continue
-                
-            sentences = cls.extract_sentences(text)
-            for sentence in sentences:
-                normalized = ' '.join(sentence.split())
-                
-                if normalized not in sentence_to_extractors:
-                    sentence_to_extractors[normalized] = set()
-                    if lib == first_lib:
-                        sentence_order.append(normalized)
-                
-                sentence_to_extractors[normalized].add(lib)
+            
+            bit = extractor_bit[lib]
+            for sentence in cls.extract_sentences(text):
+                votes[sentence] = votes.get(sentence, 0) | bit
+            
+            if lib == first_lib:
+                first_count = len(votes)
         
         # Collect sentences by vote count
         stats = {
-            'total_unique_sentences': len(sentence_to_extractors),
-            'by_vote_count': {4: [], 3: [], 2: [], 1: []},
+            'total_unique_sentences': len(votes),
+            'by_vote_count': {n: [] for n in range(max(4, len(texts)), 0, -1)},
         }
         
+        # First extractor's sentences in order, then other high-confidence ones
         high_confidence = []
-        for sentence in sentence_order:
-            vote_count = len(sentence_to_extractors[sentence])
+        for index, (sentence, mask) in enumerate(votes.items()):
+            vote_count = mask.bit_count()
             if vote_count >= min_extractors:
                 high_confidence.append(sentence)
-            stats['by_vote_count'][vote_count].append(sentence[:80] + '...' if len(sentence) > 80 else sentence)
-        
-        # Add other high-confidence sentences
-        for sentence, extractors in sentence_to_extractors.items():
-            if len(extractors) >= min_extractors and sentence not in high_confidence:
-                high_confidence.append(sentence)
+            if index < first_count:
+                stats['by_vote_count'][vote_count].append(sentence[:80] + '...' if len(sentence) > 80 else sentence)
         
         reconstructed = '. '.join(high_confidence)
         if reconstructed and not reconstructed.endswith('.'):
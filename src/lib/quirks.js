@@ -70,6 +70,14 @@ export function extractorQuirks(text, extractor) {
   return text.trim();
 }
 
+// URLs whose content is flagged instead of cleaned (live blogs). One
+// alternation per site after a shared prefix: optional scheme, "//" and
+// userinfo, then host labels. The host must end in the site's domain
+// (optionally with a trailing dot and a port) and be followed by a path,
+// query or fragment. Kept in sync with _FLAGGED_URL in quirks.py.
+const FLAGGED_URL =
+  /^(?:[a-z][a-z0-9+.-]*:)?(?:\/\/)?(?:[^\/?#@\s]*@)?(?:[^\/?#@:.\s]+\.)*(?:cnn\.com\.?(?::\d*)?[\/?#].*?live-(?:news|updates))/i;
+
 /**
  * Layer 3: Site-specific quirks
  *
@@ -77,6 +85,11 @@ export function extractorQuirks(text, extractor) {
  * Returns null if content should be flagged (e.g., live blogs).
  */
 export function siteQuirks(text, url) {
+  // Flag live blogs
+  if (FLAGGED_URL.test(url.trim())) {
+    return null;
+  }
+
   const domain = url.toLowerCase();
 
   if (domain.includes('foxnews.com')) {
@@ -85,10 +98,6 @@ export function siteQuirks(text, url) {
     text = text.replace(/Fox News['\s]+[\w\s]+contributed to this report\.?\s*$/i, '');
     text = text.replace(/[\w\s]+ is a (?:reporter|correspondent|anchor) with Fox News Digital.*?$/i, '');
     text = text.replace(/Send tips to [\w.@]+,?\s*or on (?:X|Twitter):\s*@[\w_]+\.?\s*$/i, '');
-  } else if (domain.includes('cnn.com')) {
-    if (url.includes('live-news') || url.includes('live-updates')) {
-      return null;
-    }
   }
 
   return text ? text.trim() : text;